@@ -3,6 +3,7 @@
 """
 import sys
 import fractions
+import functools
 import platform
 import types
 from typing import Any, Type
@@ -12,6 +13,26 @@
 
 from numpy.testing import assert_equal, assert_raises
 
+# ratios of the scalars closest to +-2.1, see ``test_against_known_values``
+_KNOWN_RATIOS = {
+    'half_pos': fractions.Fraction(1075, 512),
+    'half_neg': fractions.Fraction(-1075, 512),
+    'single_pos': fractions.Fraction(4404019, 2097152),
+    'single_neg': fractions.Fraction(-4404019, 2097152),
+    'double_pos': fractions.Fraction(4728779608739021, 2251799813685248),
+    'double_neg': fractions.Fraction(-4728779608739021, 2251799813685248),
+}
+
+# scalar types by type code, shared between the parametrized tests below
+_FLOAT_TYPES = {c: np.dtype(c).type for c in np.typecodes["Float"]}
+_ALL_TYPES = {c: np.dtype(c).type for c in np.typecodes["All"]}
+_REAL_CODES = np.typecodes["Float"] + np.typecodes["AllInteger"]
+# non-integral values (and a zero) for ``TestIsInteger.test_false``
+_NONINT_BASE = np.arange(-5, 5, dtype=np.float64) * 1.1
+
+# one code per distinct scalar type, e.g. 'l' and 'p' alias on LP64
+_ALL_CODES_UNIQUE = tuple({t: c for c, t in _ALL_TYPES.items()}.values())
+
 
 class TestAsIntegerRatio:
     # derived in part from the cpython test "test_floatasratio"
@@ -31,14 +52,13 @@ def test_small(self, ftype, f, ratio):
         np.half, np.single, np.double, np.longdouble])
     def test_simple_fractions(self, ftype):
         R = fractions.Fraction
-        assert_equal(R(0, 1),
-                     R(*ftype(0.0).as_integer_ratio()))
-        assert_equal(R(5, 2),
-                     R(*ftype(2.5).as_integer_ratio()))
-        assert_equal(R(1, 2),
-                     R(*ftype(0.5).as_integer_ratio()))
-        assert_equal(R(-2100, 1),
-                     R(*ftype(-2100.0).as_integer_ratio()))
+        for f, expected in [
+                (0.0, R(0, 1)),
+                (2.5, R(5, 2)),
+                (0.5, R(1, 2)),
+                (-2100.0, R(-2100, 1))]:
+            n, d = ftype(f).as_integer_ratio()
+            assert_equal(expected, R(int(n), int(d)))
 
     @pytest.mark.parametrize("ftype", [
         np.half, np.single, np.double, np.longdouble])
@@ -49,18 +69,15 @@ def test_errors(self, ftype):
 
     def test_against_known_values(self):
         R = fractions.Fraction
-        assert_equal(R(1075, 512),
-                     R(*np.half(2.1).as_integer_ratio()))
-        assert_equal(R(-1075, 512),
-                     R(*np.half(-2.1).as_integer_ratio()))
-        assert_equal(R(4404019, 2097152),
-                     R(*np.single(2.1).as_integer_ratio()))
-        assert_equal(R(-4404019, 2097152),
-                     R(*np.single(-2.1).as_integer_ratio()))
-        assert_equal(R(4728779608739021, 2251799813685248),
-                     R(*np.double(2.1).as_integer_ratio()))
-        assert_equal(R(-4728779608739021, 2251799813685248),
-                     R(*np.double(-2.1).as_integer_ratio()))
+        for key, ftype, f in [
+                ('half_pos', np.half, 2.1),
+                ('half_neg', np.half, -2.1),
+                ('single_pos', np.single, 2.1),
+                ('single_neg', np.single, -2.1),
+                ('double_pos', np.double, 2.1),
+                ('double_neg', np.double, -2.1)]:
+            n, d = ftype(f).as_integer_ratio()
+            assert_equal(_KNOWN_RATIOS[key], R(int(n), int(d)))
         # longdouble is platform dependent
 
     @pytest.mark.parametrize("ftype, frac_vals, exp_vals", [
@@ -91,9 +108,9 @@ def test_against_known_values(self):
         )
     ])
     def test_roundtrip(self, ftype, frac_vals, exp_vals):
-        for frac, exp in zip(frac_vals, exp_vals):
-            f = np.ldexp(ftype(frac), exp)
-            assert f.dtype == ftype
+        fs = np.ldexp(np.asarray(frac_vals, dtype=ftype), np.asarray(exp_vals))
+        assert fs.dtype == ftype
+        for f in fs:
             n, d = f.as_integer_ratio()
 
             try:
@@ -111,13 +128,11 @@ class TestIsInteger:
     @pytest.mark.parametrize("str_value", ["inf", "nan"])
     @pytest.mark.parametrize("code", np.typecodes["Float"])
     def test_special(self, code: str, str_value: str) -> None:
-        cls = np.dtype(code).type
+        cls = _FLOAT_TYPES[code]
         value = cls(str_value)
         assert not value.is_integer()
 
-    @pytest.mark.parametrize(
-        "code", np.typecodes["Float"] + np.typecodes["AllInteger"]
-    )
+    @pytest.mark.parametrize("code", _REAL_CODES)
     def test_true(self, code: str) -> None:
         float_array = np.arange(-5, 5).astype(code)
         for value in float_array:
@@ -125,11 +140,9 @@ def test_true(self, code: str) -> None:
 
     @pytest.mark.parametrize("code", np.typecodes["Float"])
     def test_false(self, code: str) -> None:
-        float_array = np.arange(-5, 5).astype(code)
-        float_array *= 1.1
-        for value in float_array:
-            if value == 0:
-                continue
+        float_array = _NONINT_BASE.astype(code)
+        nonzero = float_array[np.nonzero(float_array)]
+        for value in nonzero:
             assert not value.is_integer()
 
 
@@ -158,9 +171,9 @@ def test_abc_non_numeric(self, cls: Type[np.generic]) -> None:
         with pytest.raises(TypeError):
             cls[Any]
 
-    @pytest.mark.parametrize("code", np.typecodes["All"])
+    @pytest.mark.parametrize("code", _ALL_CODES_UNIQUE)
     def test_concrete(self, code: str) -> None:
-        cls = np.dtype(code).type
+        cls = _ALL_TYPES[code]
         with pytest.raises(TypeError):
             cls[Any]
 
@@ -185,19 +198,33 @@ def test_class_getitem_38(cls: Type[np.number]) -> None:
         cls[Any]
 
 
+@functools.lru_cache(maxsize=None)
+def _popcount_ref(lo, hi):
+    # reference popcounts for ``TestBitCount``, shared between integer types.
+    # Counting the unpacked bits is independent of the ``bit_count``
+    # implementation under test and stays cheap for large ranges.
+    vals = np.arange(lo, hi, dtype=np.uint64)
+    bits = np.unpackbits(vals.view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1, dtype=np.uint8)
+
+
 class TestBitCount:
     # derived in part from the cpython test "test_bit_count"
 
     @pytest.mark.parametrize("itype", np.sctypes['int']+np.sctypes['uint'])
     def test_small(self, itype):
-        for a in range(max(np.iinfo(itype).min, 0), 128):
-            msg = f"Smoke test for {itype}({a}).bit_count()"
-            assert itype(a).bit_count() == bin(a).count("1"), msg
-
-    def test_bit_count(self):
-        for exp in [10, 17, 63]:
-            a = 2**exp
-            assert np.uint64(a).bit_count() == 1
-            assert np.uint64(a - 1).bit_count() == exp
-            assert np.uint64(a ^ 63).bit_count() == 7
-            assert np.uint64((a - 1) ^ 510).bit_count() == exp - 8
+        lo = max(np.iinfo(itype).min, 0)
+        arr = np.arange(lo, 128, dtype=itype)
+        expected = _popcount_ref(lo, 128)
+        res = np.fromiter((a.bit_count() for a in arr),
+                          dtype=np.uint8, count=arr.size)
+        assert_equal(res, expected,
+                     err_msg=f"Smoke test for {itype}.bit_count()")
+
+    @pytest.mark.parametrize("exp", [10, 17, 63])
+    def test_bit_count(self, exp):
+        a = 2**exp
+        assert np.uint64(a).bit_count() == 1
+        assert np.uint64(a - 1).bit_count() == exp
+        assert np.uint64(a ^ 63).bit_count() == 7
+        assert np.uint64((a - 1) ^ 510).bit_count() == exp - 8
@@ -288,6 +288,9 @@ class as self with identical domain and window. If so,
         return other
 
     def __init__(self, coef, domain=None, window=None):
+        if type(coef) is type(self):
+            # use the coefficient array rather than iterating over the series
+            coef = coef.coef
         [coef] = pu.as_series([coef], trim=False)
         self.coef = coef
 
@@ -337,9 +340,14 @@ def _generate_string(self, term_method):
         linewidth = np.get_printoptions().get('linewidth', 75)
         if linewidth < 1:
             linewidth = 1
-        out = f"{self.coef[0]}"
+        parts = [f"{self.coef[0]}"]
+        # Length of the current line, tracked instead of re-splitting the
+        # output for every term
+        cur_len = len(parts[0].rpartition("\n")[2])
+        nterms = len(self.coef) - 1
         for i, coef in enumerate(self.coef[1:]):
-            out += " "
+            parts.append(" ")
+            cur_len += 1
             power = str(i + 1)
             # Polynomial coefficient
             # The coefficient array can be an object array with elements that
@@ -355,16 +363,18 @@ def _generate_string(self, term_method):
             # Polynomial term
             next_term += term_method(power, "x")
             # Length of the current line with next term added
-            line_len = len(out.split('\n')[-1]) + len(next_term)
+            line_len = cur_len + len(next_term)
             # If not the last term in the polynomial, it will be two
             # characters longer due to the +/- with the next term
-            if i < len(self.coef[1:]) - 1:
+            if i < nterms - 1:
                 line_len += 2
             # Handle linebreaking
             if line_len >= linewidth:
                 next_term = next_term.replace(" ", "\n", 1)
-            out += next_term
-        return out
+            parts.append(next_term)
+            _, newline, tail = next_term.rpartition("\n")
+            cur_len = len(tail) if newline else cur_len + len(tail)
+        return "".join(parts)
 
     @classmethod
     def _str_term_unicode(cls, i, arg_str):
@@ -614,10 +624,11 @@ def __rdivmod__(self, other):
         return quo, rem
 
     def __eq__(self, other):
+        # compare the shapes first, they are cheaper than the arrays
         res = (isinstance(other, self.__class__) and
+               (self.coef.shape == other.coef.shape) and
                np.all(self.domain == other.domain) and
                np.all(self.window == other.window) and
-               (self.coef.shape == other.coef.shape) and
                np.all(self.coef == other.coef))
         return res
 
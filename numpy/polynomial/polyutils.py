@@ -127,23 +127,29 @@ def as_series(alist, trim=True):
     [array([2.]), array([1.1, 0. ])]
 
     """
-    arrays = [np.array(a, ndmin=1, copy=False) for a in alist]
-    if min([a.size for a in arrays]) == 0:
+    arrays = []
+    for a in alist:
+        arr = np.asarray(a)
+        if arr.ndim == 0:
+            arr = arr[np.newaxis]
+        arrays.append(arr)
+    if not arrays:
         raise ValueError("Coefficient array is empty")
-    if any(a.ndim != 1 for a in arrays):
-        raise ValueError("Coefficient array is not 1-d")
+    obj_dtype = np.dtype(object)
+    has_object = False
+    for a in arrays:
+        if a.size == 0:
+            raise ValueError("Coefficient array is empty")
+        if a.ndim != 1:
+            raise ValueError("Coefficient array is not 1-d")
+        if a.dtype == obj_dtype:
+            has_object = True
     if trim:
         arrays = [trimseq(a) for a in arrays]
 
-    if any(a.dtype == np.dtype(object) for a in arrays):
-        ret = []
-        for a in arrays:
-            if a.dtype != np.dtype(object):
-                tmp = np.empty(len(a), dtype=np.dtype(object))
-                tmp[:] = a[:]
-                ret.append(tmp)
-            else:
-                ret.append(a.copy())
+    if has_object:
+        # astype always copies, in a single pass
+        ret = [a.astype(obj_dtype) for a in arrays]
     else:
         try:
             dtype = np.common_type(*arrays)
@@ -246,7 +252,7 @@ def getdomain(x):
 
     """
     [x] = as_series([x], trim=False)
-    if x.dtype.char in np.typecodes['Complex']:
+    if issubclass(x.dtype.type, np.complexfloating):
         rmin, rmax = x.real.min(), x.real.max()
         imin, imax = x.imag.min(), x.imag.max()
         return np.array((complex(rmin, imin), complex(rmax, imax)))
@@ -368,6 +374,7 @@ def mapdomain(x, old, new):
     return off + scl*x
 
 
+@functools.lru_cache(maxsize=64)
 def _nth_slice(i, ndim):
     sl = [np.newaxis] * ndim
     sl[i] = slice(None)
@@ -429,8 +436,13 @@ def _vander_nd(vander_fs, points, degrees):
     if n_dims == 0:
         raise ValueError("Unable to guess a dtype or shape when no points are given")
 
-    # convert to the same shape and type
-    points = tuple(np.array(tuple(points), copy=False) + 0.0)
+    # convert to the same type, casting each axis once rather than stacking
+    # them all into a temporary array
+    points = tuple(np.asarray(p) for p in points)
+    if any(p.shape != points[0].shape for p in points[1:]):
+        raise ValueError("Sample point arrays must all have the same shape")
+    dtype = np.result_type(*(p.dtype for p in points), 0.0)
+    points = tuple(p.astype(dtype, copy=False) for p in points)
 
     # produce the vandermonde matrix for each dimension, placing the last
     # axis of each in an independent trailing axis of the output
@@ -474,12 +486,14 @@ def _fromroots(line_f, mul_f, roots):
         p = [line_f(-r, 1) for r in roots]
         n = len(p)
         while n > 1:
+            # multiply adjacent pairs, reusing the front of the list for
+            # the products and carrying over any unpaired factor
             m, r = divmod(n, 2)
-            tmp = [mul_f(p[i], p[i+m]) for i in range(m)]
+            for i in range(m):
+                p[i] = mul_f(p[2*i], p[2*i + 1])
             if r:
-                tmp[0] = mul_f(tmp[0], p[-1])
-            p = tmp
-            n = m
+                p[m] = p[n - 1]
+            n = m + r
         return p[0]
 
 
@@ -626,7 +640,9 @@ def _fit(vander_f, x, y, deg, rcond=None, full=False, w=None):
         order = lmax + 1
         van = vander_f(x, lmax)
     else:
-        deg = np.sort(deg)
+        # most callers pass the degrees in order already
+        if not np.all(deg[:-1] <= deg[1:]):
+            deg = np.sort(deg)
         lmax = deg[-1]
         order = len(deg)
         van = vander_f(x, lmax)[:, deg]
@@ -650,10 +666,14 @@ def _fit(vander_f, x, y, deg, rcond=None, full=False, w=None):
         rcond = len(x)*np.finfo(x.dtype).eps
 
     # Determine the norms of the design matrix columns.
+    # einsum forms the row sums of squares without a temporary the size
+    # of lhs.
     if issubclass(lhs.dtype.type, np.complexfloating):
-        scl = np.sqrt((np.square(lhs.real) + np.square(lhs.imag)).sum(1))
+        lr, li = lhs.real, lhs.imag
+        scl = np.sqrt(np.einsum('ij,ij->i', lr, lr) +
+                      np.einsum('ij,ij->i', li, li))
     else:
-        scl = np.sqrt(np.square(lhs).sum(1))
+        scl = np.sqrt(np.einsum('ij,ij->i', lhs, lhs))
     scl[scl == 0] = 1
 
     # Solve the least squares problem.
@@ -705,11 +725,16 @@ def _pow(mul_f, c, pow, maxpower):
     elif power == 1:
         return c
     else:
-        # This can be made more efficient by using powers of two
-        # in the usual way.
-        prd = c
-        for i in range(2, power + 1):
-            prd = mul_f(prd, c)
+        # exponentiation by squaring, which needs O(log(power))
+        # multiplications rather than power - 1.
+        prd = None
+        base = c
+        while power:
+            if power & 1:
+                prd = base if prd is None else mul_f(prd, base)
+            power >>= 1
+            if power:
+                base = mul_f(base, base)
         return prd
 
 
@@ -729,6 +754,9 @@ def _deprecate_as_int(x, desc):
     TypeError : if x is a non-integral float or non-numeric
     DeprecationWarning : if x is an integral float
     """
+    # fast path for the common case of a plain int
+    if type(x) is int:
+        return x
     try:
         return operator.index(x)
     except TypeError as e:
@@ -427,6 +427,20 @@ def test_copy(Poly):
     assert_(p1.window is not p2.window)
 
 
+def test_from_series(Poly):
+    p1 = Poly([1, 2, 3], domain=[0, 1], window=[-1, 2])
+    p2 = Poly(p1)
+    assert_equal(p2.coef, p1.coef)
+    assert_(p2.coef is not p1.coef)
+    # domain and window are not taken from the series
+    assert_equal(p2.domain, Poly.domain)
+    assert_equal(p2.window, Poly.window)
+    p3 = Poly(p1, domain=[1, 2])
+    assert_equal(p3.coef, p1.coef)
+    assert_equal(p3.domain, [1, 2])
+    assert_equal(p3.window, Poly.window)
+
+
 def test_integ(Poly):
     P = Polynomial
     # Check defaults
@@ -8,6 +8,7 @@
 from numpy.polynomial.polynomial import polyval
 from numpy.testing import (
     assert_almost_equal, assert_raises, assert_equal, assert_,
+    assert_allclose,
     )
 
 L0 = np.array([1])/1
@@ -102,8 +103,10 @@ def test_lagpow(self):
                 msg = f"At i={i}, j={j}"
                 c = np.arange(i + 1)
                 tgt = reduce(lag.lagmul, [c]*j, np.array([1]))
-                res = lag.lagpow(c, j) 
-                assert_equal(trim(res), trim(tgt), err_msg=msg)
+                res = lag.lagpow(c, j)
+                # squaring rounds differently than repeated multiplication
+                assert_allclose(trim(res), trim(tgt), rtol=1e-13,
+                                err_msg=msg)
 
 
 class TestEvaluation:
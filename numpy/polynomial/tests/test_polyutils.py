@@ -19,6 +19,8 @@ def test_trimseq(self):
     def test_as_series(self):
         # check exceptions
         assert_raises(ValueError, pu.as_series, [[]])
+        assert_raises(ValueError, pu.as_series, [])
+        assert_raises(ValueError, pu.as_series, np.empty((0, 3)))
         assert_raises(ValueError, pu.as_series, [[[1, 2]]])
         assert_raises(ValueError, pu.as_series, [[1], ['a']])
         # check common types
@@ -47,6 +49,10 @@ def test_vander_nd_exception(self):
         assert_raises(ValueError, pu._vander_nd, (), (), [90.65])
         # n_dims == 0
         assert_raises(ValueError, pu._vander_nd, (), (), [])
+        # points of different shapes
+        fs = (np.polynomial.polynomial.polyvander,)*2
+        assert_raises(ValueError, pu._vander_nd, fs, ([1, 2, 3], [5]), [1, 1])
+        assert_raises(ValueError, pu._vander_nd, fs, ([1, 2, 3], 5), [1, 1])
 
     def test_div_zerodiv(self):
         # c2[-1] == 0